@@ -17,6 +17,7 @@ from mesa.space import Coordinate, MultiGrid
 
 from prey_predator.agents import Animal, GrassPatch, Sheep, Wolf
 from prey_predator.schedule import RandomActivationByBreed
+from prey_predator.spatial import SpatialAnalytics
 
 WORLD_SIZE = (20, 20)
 
@@ -44,9 +45,14 @@ class WolfSheep(Model):
         wolf_energy_gain_from_food: float,
         wolf_reproduction_energy_cost: float,
         wolf_reproduction_chance: float,
+        # Scheduling
+        parallel_workers: int = 0,
     ):
         """
         Create a new Wolf-Sheep model with the given parameters.
+
+        `parallel_workers` threads step each breed over a checkerboard
+        partition of the grid, `0` steps every agent sequentially.
         """
         super().__init__()
 
@@ -73,8 +79,8 @@ class WolfSheep(Model):
         self.wolf_reproduction_chance = wolf_reproduction_chance
 
         ############
-        self.schedule = RandomActivationByBreed(self)
         self.grid = MultiGrid(self.height, self.width, torus=True)
+        self.schedule = RandomActivationByBreed(self, self.grid, parallel_workers)
         self.datacollector = DataCollector(
             {
                 "Average Grass Growth": lambda x: x.__get_average_metric_for(
@@ -94,6 +100,11 @@ class WolfSheep(Model):
                 ),
                 "# Sheeps": self.__get_number_of(Sheep),
                 "# Wolves": self.__get_number_of(Wolf),
+                "Sheep Density Variance": lambda x: x.spatial.variance(Sheep),
+                "Wolf Density Variance": lambda x: x.spatial.variance(Wolf),
+                "Sheep Clustering": lambda x: x.spatial.autocorrelation(Sheep),
+                "Wolf Clustering": lambda x: x.spatial.autocorrelation(Wolf),
+                "Predator-Prey Overlap": lambda x: x.spatial.overlap(Sheep, Wolf),
             }
         )
 
@@ -124,6 +135,10 @@ class WolfSheep(Model):
                 )
                 self.add_agent(grass, (x, y))
 
+        self.spatial = SpatialAnalytics(
+            self.grid, self.schedule, self.moore, Sheep, Wolf
+        )
+
     def create_sheep(self, pos: Coordinate, energy: float):
         return Sheep(
             self.next_id(),
@@ -160,6 +175,7 @@ class WolfSheep(Model):
         self.reproduce_animals()
 
         # Collect data
+        self.spatial.update()
         self.datacollector.collect(self)
 
     def reproduce_animals(self):
@@ -261,8 +277,11 @@ class WolfSheep(Model):
         self.grid.remove_agent(agent)
 
     def run_model(self, step_count=200):
-        for i in range(step_count):
-            self.step()
+        try:
+            for i in range(step_count):
+                self.step()
+        finally:
+            self.schedule.close()
 
     ################### Functions to calculate statistics to be displayed in the mesa interface
 
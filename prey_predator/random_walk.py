@@ -15,6 +15,8 @@ class RandomWalker(Agent):
 
     """
 
+    rng = None
+
     def __init__(
         self,
         unique_id: int,
@@ -28,12 +30,20 @@ class RandomWalker(Agent):
         - `grid` (MultiGrid): The grid in which the agent lives.
         - `pos` (int, int): The agents current position in the grid.
         - `moore` (bool): If True, may move in all 8 directions. Otherwise, only up, down, left, right.
+
+        Internal State:
+        - `rng` (Random | None): Random generator used instead of the model's one when set, e.g. by a parallel scheduler.
+          Having it lets the scheduler step the agent in parallel.
         """
         super().__init__(unique_id, model)
         self.grid = grid
         self.pos = pos
         self.moore = moore
 
+    @property
+    def random(self):
+        return self.rng if self.rng is not None else self.model.random
+
     def random_move(self):
         """
         Step one cell in any allowable direction.
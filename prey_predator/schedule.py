@@ -1,7 +1,12 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
 
 from mesa.time import RandomActivation
 
+# The four colors of the checkerboard, as the parity of a block's coordinates
+BLOCK_COLORS = [(0, 0), (0, 1), (1, 0), (1, 1)]
+
 
 class RandomActivationByBreed(RandomActivation):
     """
@@ -12,11 +17,49 @@ class RandomActivationByBreed(RandomActivation):
     default behavior for an ABM.
 
     Assumes that all agents have a step() method.
+
+    When `workers` is positive, breeds with an `rng` class attribute are
+    stepped in parallel: the torus is cut into square blocks of `block_size`
+    cells colored like a checkerboard by the parity of their coordinates.
+    Blocks of the same color are at least one block apart, so agents moving
+    one cell from them never meet and the blocks run concurrently on a thread
+    pool, one color at a time. Each block shuffles its agents and sets their
+    `rng` to its own generator seeded from the model's, so a run is
+    reproducible for a given seed whatever the thread timing. Other breeds,
+    which could only draw from the shared model generator, are stepped
+    sequentially. Call `close()` to release the threads once the run is over.
     """
 
-    def __init__(self, model):
+    def __init__(self, model, grid=None, workers=0, block_size=5):
+        """
+        Args:
+            model: The model the agents belong to.
+            grid: The torus the agents live in, required to step in parallel.
+            workers: Number of threads used to step a breed, `0` to step sequentially.
+            block_size: Side of the checkerboard blocks, in cells.
+        """
         super().__init__(model)
         self.agents_by_breed = defaultdict(dict)
+        self.grid = grid
+        self.workers = workers
+        self.block_size = block_size
+        self.executor = None
+        if workers > 0:
+            self.__check_partition()
+
+    def __check_partition(self):
+        if self.grid is None:
+            raise ValueError("A grid is required to step in parallel")
+        if self.block_size < 2:
+            raise ValueError(
+                "Blocks must be at least 2 cells wide to keep same colors apart"
+            )
+        period = 2 * self.block_size
+        if self.grid.width % period != 0 or self.grid.height % period != 0:
+            raise ValueError(
+                f"Grid of size {self.grid.width}x{self.grid.height} can't be split in "
+                f"an even number of blocks of size {self.block_size} in each direction"
+            )
 
     def add(self, agent):
         """
@@ -63,11 +106,69 @@ class RandomActivationByBreed(RandomActivation):
         Args:
             breed: Class object of the breed to run.
         """
+        if self.workers > 0 and hasattr(breed, "rng"):
+            self.step_breed_parallel(breed)
+            return
         agent_keys = list(self.agents_by_breed[breed].keys())
         self.model.random.shuffle(agent_keys)
         for agent_key in agent_keys:
             self.agents_by_breed[breed][agent_key].step()
 
+    def step_breed_parallel(self, breed):
+        """
+        Run all agents of a given breed, one checkerboard color at a time,
+        with the blocks of a color stepped concurrently.
+
+        Args:
+            breed: Class object of the breed to run.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers)
+
+        # Assign agents to blocks from their position at the start of the step,
+        # so an agent moving into another block is not run twice
+        blocks = defaultdict(list)
+        for agent_key, agent in self.agents_by_breed[breed].items():
+            x, y = agent.pos
+            blocks[(x // self.block_size, y // self.block_size)].append(agent_key)
+
+        for color in BLOCK_COLORS:
+            color_blocks = sorted(
+                block for block in blocks if (block[0] % 2, block[1] % 2) == color
+            )
+            # Seeds are drawn in block order so the outcome doesn't depend on thread timing
+            futures = [
+                self.executor.submit(
+                    self.__step_block,
+                    breed,
+                    blocks[block],
+                    Random(self.model.random.getrandbits(64)),
+                )
+                for block in color_blocks
+            ]
+            for future in futures:
+                future.result()
+
+    def __step_block(self, breed, agent_keys, rng):
+        rng.shuffle(agent_keys)
+        for agent_key in agent_keys:
+            agent = self.agents_by_breed[breed][agent_key]
+            agent.rng = rng
+            try:
+                agent.step()
+            finally:
+                agent.rng = None
+
+    def close(self):
+        """
+        Shut down the threads used to step in parallel.
+
+        They are started again by the next parallel step.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
     def get_breed(self, breed_class):
         """
         Returns the agents of certain breed in the queue.
@@ -67,6 +67,19 @@ server = ModularServer(
                 {"Label": "# Wolves", "Color": "green"},
             ]
         ),
+        ChartModule(
+            [
+                {"Label": "Sheep Density Variance", "Color": "red"},
+                {"Label": "Wolf Density Variance", "Color": "green"},
+            ]
+        ),
+        ChartModule(
+            [
+                {"Label": "Sheep Clustering", "Color": "red"},
+                {"Label": "Wolf Clustering", "Color": "green"},
+                {"Label": "Predator-Prey Overlap", "Color": "blue"},
+            ]
+        ),
     ],
     "Prey Predator Model",
     # Model Params
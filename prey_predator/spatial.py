@@ -0,0 +1,136 @@
+"""
+Spatial analytics computed from per-breed density rasters.
+"""
+
+from typing import Dict, Type
+
+import numpy as np
+from mesa import Agent
+from mesa.space import MultiGrid
+
+from prey_predator.schedule import RandomActivationByBreed
+
+
+class SpatialAnalytics:
+    """
+    Builds a density raster (agent count per cell) for each tracked breed and
+    computes vectorized summary statistics on top of it.
+
+    Internal State:
+    - `densities` (dict[type, ndarray]): The `(width, height)` count raster of each breed.
+    - `variances` (dict[type, float]): The variance of each breed's raster.
+    - `autocorrelations` (dict[type, float]): The Moran's I of each breed's raster.
+
+    Each call to `update`:
+    - Every raster is rebuilt with a single `np.bincount` over the positions of the breed's agents.
+    - The variance and Moran's I of every raster are recomputed.
+    """
+
+    def __init__(
+        self,
+        grid: MultiGrid,
+        schedule: RandomActivationByBreed,
+        moore: bool,
+        *breeds: Type[Agent],
+    ):
+        """
+        Args:
+        - `grid` (MultiGrid): The grid in which the agents live.
+        - `schedule` (RandomActivationByBreed): The schedule holding the agents by breed.
+        - `moore` (bool): If True, autocorrelation uses all 8 neighbours. Otherwise, only up, down, left, right.
+        - `breeds` (type): The agent classes to build rasters for.
+        """
+        self.grid = grid
+        self.schedule = schedule
+        self.moore = moore
+        self.breeds = breeds
+        self.densities: Dict[Type[Agent], np.ndarray] = {}
+        self.variances: Dict[Type[Agent], float] = {}
+        self.autocorrelations: Dict[Type[Agent], float] = {}
+        self.update()
+
+    def update(self):
+        """
+        Rebuild the density raster and statistics of every tracked breed.
+        """
+        size = self.grid.width * self.grid.height
+        for breed in self.breeds:
+            agents = self.schedule.get_breed(breed)
+            indices = np.fromiter(
+                (a.pos[0] * self.grid.height + a.pos[1] for a in agents),
+                dtype=np.intp,
+                count=len(agents),
+            )
+            density = np.bincount(indices, minlength=size)
+            self.densities[breed] = density.reshape(self.grid.width, self.grid.height)
+            # Sum of squared deviations, expanded so the raw counts can be used
+            correction = len(agents) ** 2 / size
+            sum_of_squares = int(density @ density) - correction
+            self.variances[breed] = sum_of_squares / size
+            self.autocorrelations[breed] = self.__morans_i(
+                self.densities[breed], correction, sum_of_squares
+            )
+
+    def density(self, breed: Type[Agent]) -> np.ndarray:
+        """
+        Returns the `(width, height)` count raster of the given breed.
+        """
+        return self.densities[breed]
+
+    def variance(self, breed: Type[Agent]) -> float:
+        """
+        Returns the variance of the per-cell counts of the given breed.
+        """
+        return self.variances[breed]
+
+    def autocorrelation(self, breed: Type[Agent]) -> float:
+        """
+        Returns Moran's I of the given breed's raster on the torus.
+
+        Positive values mean the breed is clustered and negative values mean it
+        is spread out in a checkerboard-like pattern. Under spatial randomness,
+        the expected value is `-1 / (N - 1)` with `N` the number of cells.
+        """
+        return self.autocorrelations[breed]
+
+    def overlap(self, breed_a: Type[Agent], breed_b: Type[Agent]) -> float:
+        """
+        Returns the overlap index between two breeds, the cosine similarity of their rasters.
+
+        The index is `1` when both breeds are distributed identically and `0`
+        when they never share a cell.
+        """
+        density_a = self.densities[breed_a].ravel()
+        density_b = self.densities[breed_b].ravel()
+        norms = np.sqrt(float(density_a @ density_a) * float(density_b @ density_b))
+        if norms == 0:
+            return 0.0
+        return float(density_a @ density_b) / norms
+
+    def __morans_i(
+        self, density: np.ndarray, correction: float, sum_of_squares: float
+    ) -> float:
+        if sum_of_squares <= 0:
+            return 0.0
+        # Pad the raster with its wrapped-around row and columns, and keep a
+        # copy with zeroed padding so only real cells are paired with a neighbour.
+        # Each neighbour is then a fixed offset in the flattened arrays.
+        width, height = density.shape
+        wrapped = np.empty((width + 1, height + 2), dtype=density.dtype)
+        wrapped[:width, 1:-1] = density
+        wrapped[width, 1:-1] = density[0]
+        wrapped[:, 0] = wrapped[:, height]
+        wrapped[:, -1] = wrapped[:, 1]
+        cells = np.zeros_like(wrapped)
+        cells[:width, 1:-1] = density
+        wrapped, cells = wrapped.ravel(), cells.ravel()
+        # Each offset stands for a pair of opposite neighbours, which contribute equally
+        row = height + 2
+        offsets = [row, 1]
+        if self.moore:
+            offsets += [row + 1, row - 1]
+        cross_products = sum(
+            int(cells[: cells.size - offset] @ wrapped[offset:]) - correction
+            for offset in offsets
+        )
+        return cross_products / (len(offsets) * sum_of_squares)